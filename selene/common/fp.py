@@ -45,3 +45,26 @@ def pipe(*functions):
         if functions
         else None
     )
+
+
+def memoized(maxsize: int = 128):
+    """
+    same as functools.lru_cache(maxsize, typed=True)
+    but just calls decorated function without caching
+    if some of passed arguments are unhashable (like lists)
+    """
+
+    def decorator(fn):
+        cached = functools.lru_cache(maxsize=maxsize, typed=True)(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                hash((args, tuple(kwargs.items())))
+            except TypeError:
+                return fn(*args, **kwargs)
+            return cached(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -20,7 +20,11 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import operator
 import re
+from functools import partial
+
+from selene.common.fp import memoized
 
 
 def is_truthy(something):
@@ -31,88 +35,74 @@ def equals_ignoring_case(expected):
     return lambda actual: str(expected).lower() == str(actual).lower()
 
 
+@memoized(maxsize=256)
 def equals(expected, ignore_case=False):
-    return (
-        lambda actual: expected == actual
-        if not ignore_case
-        else equals_ignoring_case(expected)
-    )
+    if ignore_case:
+        return equals_ignoring_case(expected)
+
+    return partial(operator.eq, expected)
 
 
+@memoized(maxsize=256)
 def is_greater_than(expected):
-    return lambda actual: actual > expected
+    return partial(operator.lt, expected)
 
 
+@memoized(maxsize=256)
 def is_greater_than_or_equal(expected):
-    return lambda actual: actual >= expected
+    return partial(operator.le, expected)
 
 
+@memoized(maxsize=256)
 def is_less_than(expected):
-    return lambda actual: actual < expected
+    return partial(operator.gt, expected)
 
 
+@memoized(maxsize=256)
 def is_less_than_or_equal(expected):
-    return lambda actual: actual <= expected
+    return partial(operator.ge, expected)
 
 
 def includes_ignoring_case(expected):
     return lambda actual: str(expected).lower() in str(actual).lower()
 
 
+@memoized(maxsize=256)
 def includes(expected, ignore_case=False):
+    if ignore_case:
+        return includes_ignoring_case(expected)
+
     def fn(actual):
         try:
-            return (
-                expected in actual
-                if not ignore_case
-                else includes_ignoring_case(expected)
-            )
+            return expected in actual
         except TypeError:
             return False
 
     return fn
 
 
+def _word_pattern(word, flags=0):
+    return re.compile(r'(?<!\S)' + re.escape(str(word)) + r'(?!\S)', flags)
+
+
 def includes_word_ignoring_case(expected):
-    return lambda actual: str(expected).lower() in re.split(
-        r'\s+', str(actual).lower()
-    )
+    search = _word_pattern(expected, re.IGNORECASE).search
+    return lambda actual: search(str(actual)) is not None
 
 
 def includes_word(expected, ignore_case=False):
-    return (
-        lambda actual: expected in re.split(r'\s+', actual)
-        if not ignore_case
-        else includes_ignoring_case(expected)
-    )
-
-
-# will not work with empty seqs :( todo: fix
-# currently we use it only for non-empty seqs taking this into account
-seq_compare_by = (
-    lambda f: lambda x=None, *xs: lambda y=None, *ys: True
-    if x is None and y is None
-    else bool(f(x)(y)) and seq_compare_by(f)(*xs)(*ys)
-)
-
+    if ignore_case:
+        return includes_word_ignoring_case(expected)
 
-# def seq_compare_by_2(f):
-#     def fn(x, *xs):
-#         def fn(y, *ys):
-#             return True if x is None and y is None else \
-#                 bool(f(x)(y)) and seq_compare_by(f)(*xs or (None, ))(*ys or (None, ))
-#         return fn
-#     return fn
+    search = _word_pattern(expected).search
+    return lambda actual: search(actual) is not None
 
 
 list_compare_by = lambda f: lambda expected: lambda actual: (
-    seq_compare_by(f)(*expected)(*actual)
+    len(expected) == len(actual)
+    and all(f(x)(y) for x, y in zip(expected, actual))
 )
 
 
-# list_compare_by = lambda f: lambda expected: lambda actual: \
-#     seq_compare_by(f)(* expected if expected else (None,))(* actual if actual else (None, ))
-
-
-equals_to_list = list_compare_by(equals)
-equals_by_contains_to_list = list_compare_by(includes)
+equals_to_list = memoized(maxsize=256)(list_compare_by(equals))
+equals_by_contains_to_list = memoized(maxsize=256)(list_compare_by(includes))
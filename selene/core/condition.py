@@ -22,7 +22,7 @@
 
 from __future__ import annotations
 
-from typing import List, TypeVar, Callable
+from typing import List, TypeVar, Callable, Union
 
 from selene.core.exceptions import ConditionNotMatchedError
 from selene.core.wait import Predicate, Lambda
@@ -31,19 +31,44 @@ from selene.core.wait import Predicate, Lambda
 E = TypeVar('E')
 R = TypeVar('R')
 
+# description can be passed as a function to be rendered lazily,
+# i.e. only when it is needed (usually only on failure)
+Description = Union[str, Callable[[], str]]
+
+
+def _cached(entity: E) -> E:
+    """
+    resolves entity's webelement(s) once, so composed conditions
+    will reuse it in all their sub-conditions over the same poll,
+    instead of finding it again for each sub-condition
+    """
+    # todo: should we move `cached` to some common Located base class?
+    from selene.core.entity import Element, Collection  # circular otherwise
+
+    if not isinstance(entity, (Element, Collection)):
+        return entity
+    try:
+        return entity.cached
+    except Exception:
+        return entity
+
 
 class Condition(Callable[[E], None]):
+    __slots__ = ('_description', '_fn')
+
     @classmethod
     def by_and(cls, *conditions):
         def fn(entity):
+            entity = _cached(entity)
             for condition in conditions:
                 condition.call(entity)
 
-        return cls(' and '.join(map(str, conditions)), fn)
+        return cls(lambda: ' and '.join(map(str, conditions)), fn)
 
     @classmethod
     def by_or(cls, *conditions):
         def fn(entity):
+            entity = _cached(entity)
             errors: List[Exception] = []
             for condition in conditions:
                 try:
@@ -53,18 +78,19 @@ class Condition(Callable[[E], None]):
                     errors.append(e)
             raise AssertionError('; '.join(map(str, errors)))
 
-        return cls(' or '.join(map(str, conditions)), fn)
+        return cls(lambda: ' or '.join(map(str, conditions)), fn)
 
     @classmethod
     def as_not(
-        cls, condition: Condition[E], description: str = None
+        cls, condition: Condition[E], description: Description = None
     ) -> Condition[E]:
-        # todo: how will it work composed conditions?
-        condition_words = str(condition).split(' ')
-        is_or_have = condition_words[0]
-        name = ' '.join(condition_words[1:])
-        no_or_not = 'not' if is_or_have == 'is' else 'no'
-        new_description = description or f'{is_or_have} {no_or_not} {name}'
+        def new_description():
+            # todo: how will it work composed conditions?
+            condition_words = str(condition).split(' ')
+            is_or_have = condition_words[0]
+            name = ' '.join(condition_words[1:])
+            no_or_not = 'not' if is_or_have == 'is' else 'no'
+            return f'{is_or_have} {no_or_not} {name}'
 
         def fn(entity):
             try:
@@ -73,7 +99,7 @@ class Condition(Callable[[E], None]):
                 return
             raise ConditionNotMatchedError()  # todo: try to handle printing actual values here too...
 
-        return cls(new_description, fn)
+        return cls(description or new_description, fn)
 
     # function throwIfNot<E>(predicate: (entity: E) => Promise<boolean>): Lambda<E, void> {
     #     return async (entity: E) => {
@@ -85,7 +111,7 @@ class Condition(Callable[[E], None]):
 
     @classmethod
     def raise_if_not(
-        cls, description: str, predicate: Predicate[E]
+        cls, description: Description, predicate: Predicate[E]
     ) -> Condition[E]:
         def fn(entity: E) -> None:
             if not predicate(entity):
@@ -95,22 +121,26 @@ class Condition(Callable[[E], None]):
 
     @classmethod
     def raise_if_not_actual(
-        cls, description: str, query: Lambda[E, R], predicate: Predicate[R]
+        cls,
+        description: Description,
+        query: Lambda[E, R],
+        predicate: Predicate[R],
     ) -> Condition[E]:
         def fn(entity: E) -> None:
-            query_to_str = str(query)
-            result = (
-                query.__name__
-                if query_to_str.startswith('<function')
-                else query_to_str
-            )
             actual = query(entity)
             if not predicate(actual):
+                # rendering query only on failure, to keep polling cheap
+                query_to_str = str(query)
+                result = (
+                    query.__name__
+                    if query_to_str.startswith('<function')
+                    else query_to_str
+                )
                 raise AssertionError(f'actual {result}: {actual}')
 
         return cls(description, fn)
 
-    def __init__(self, description: str, fn: Lambda[E, None]):
+    def __init__(self, description: Description, fn: Lambda[E, None]):
         self._description = description
         self._fn = fn
 
@@ -139,6 +169,8 @@ class Condition(Callable[[E], None]):
         # todo: consider changing has to have on the fly for CollectionConditions
         # todo: or changing in collection locator rendering `all` to `collection`
         # todo: or changing in match.* names from collection_has_* to all_have_*
+        if callable(self._description):
+            self._description = self._description()
         return self._description
 
     def and_(self, condition: Condition[E]) -> Condition[E]:
@@ -24,12 +24,12 @@ from selene.core.entity import Browser, Element, Collection
 
 
 class ElementCondition(Condition[Element]):
-    pass
+    __slots__ = ()
 
 
 class CollectionCondition(Condition[Collection]):
-    pass
+    __slots__ = ()
 
 
 class BrowserCondition(Condition[Browser]):
-    pass
+    __slots__ = ()
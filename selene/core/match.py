@@ -20,9 +20,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import warnings
-from typing import List, Any
+from functools import lru_cache
+from typing import List, Any, Callable
+
+from selenium.webdriver.remote.webelement import WebElement
 
 from selene.common import predicate
+from selene.common.fp import memoized
 from selene.core import query
 from selene.core.condition import Condition
 from selene.core.conditions import (
@@ -31,6 +35,7 @@ from selene.core.conditions import (
     BrowserCondition,
 )
 from selene.core.entity import Collection, Element, Browser
+from selene.core.wait import Query
 
 # todo: consider moving to selene.match.element.is_visible, etc...
 element_is_visible: Condition[Element] = ElementCondition.raise_if_not(
@@ -63,19 +68,20 @@ element_is_absent: Condition[Element] = ElementCondition.as_not(
 
 element_is_focused: Condition[Element] = ElementCondition.raise_if_not(
     'is focused',
-    # todo: change in the following line to element.execute_script or element.config.driver.execute_script
-    lambda element: element()
-    == element._webdriver.execute_script('return document.activeElement'),
+    lambda element: element.execute_script(
+        'return arguments[0] === document.activeElement'
+    ),
 )
 
 
+@memoized(maxsize=256)
 def element_has_text(
     expected: str,
     describing_matched_to='has text',
     compared_by_predicate_to=predicate.includes,
 ) -> Condition[Element]:
     return ElementCondition.raise_if_not_actual(
-        describing_matched_to + ' ' + expected,
+        lambda: f'{describing_matched_to} {expected}',
         query.text,
         compared_by_predicate_to(expected),
     )
@@ -85,155 +91,172 @@ def element_has_exact_text(expected: str) -> Condition[Element]:
     return element_has_text(expected, 'has exact text', predicate.equals)
 
 
-def element_has_js_property(name: str):
-    # todo: should we keep simpler but less obvious name - *_has_property ?
-    def property_value(element: Element) -> str:
-        return element().get_property(name)
-
-    def property_values(collection: Collection) -> List[str]:
-        return [element.get_property(name) for element in collection()]
-
-    raw_property_condition = ElementCondition.raise_if_not_actual(
-        'has js property ' + name, property_value, predicate.is_truthy
-    )
-
-    class ConditionWithValues(ElementCondition):
-        def value(self, expected: str) -> Condition[Element]:
-            return ElementCondition.raise_if_not_actual(
-                f"has js property '{name}' with value '{expected}'",
-                property_value,
-                predicate.equals(expected),
+class _ConditionWithValues(ElementCondition):
+    __slots__ = ('_label', '_name', '_value', '_values')
+
+    def __init__(self, description, fn):
+        # keeps the (description, fn) signature of Condition,
+        # so inherited builders like raise_if_not or as_not work,
+        # while label, name & value queries are set by `of`
+        super().__init__(description, fn)
+        self._label = None
+        self._name = None
+        self._value = None
+        self._values = None
+
+    @classmethod
+    def of(cls, label: str, name: str, get_value: Callable[[WebElement], Any]):
+        value = Query(f'{label} {name}', lambda element: get_value(element()))
+        values = Query(
+            f'{label} {name} values',
+            lambda collection: [
+                get_value(webelement) for webelement in collection()
+            ],
+        )
+        raw_condition = ElementCondition.raise_if_not_actual(
+            lambda: f'has {label} {name}', value, predicate.is_truthy
+        )
+
+        condition = cls(lambda: str(raw_condition), raw_condition.call)
+        condition._label = label
+        condition._name = name
+        condition._value = value
+        condition._values = values
+        return condition
+
+    @property
+    def not_(self) -> Condition[Element]:
+        return _NotConditionWithValues.of(self)
+
+    def _value_condition(
+        self, describing_matched_to: str, expected, compared_by_predicate
+    ) -> Condition[Element]:
+        return ElementCondition.raise_if_not_actual(
+            lambda: (
+                f"has {self._label} '{self._name}' "
+                f"with {describing_matched_to} '{expected}'"
+            ),
+            self._value,
+            compared_by_predicate,
+        )
+
+    def _values_condition(
+        self, describing_matched_to: str, expected, compared_by_predicate
+    ) -> Condition[Collection]:
+        return CollectionCondition.raise_if_not_actual(
+            lambda: (
+                f"has {self._label} '{self._name}' "
+                f"with {describing_matched_to} '{expected}'"
+            ),
+            self._values,
+            compared_by_predicate,
+        )
+
+    def value(self, expected: str) -> Condition[Element]:
+        return self._value_condition(
+            'value', expected, predicate.equals(expected)
+        )
+
+    def value_containing(self, expected: str) -> Condition[Element]:
+        return self._value_condition(
+            'value containing', expected, predicate.includes(expected)
+        )
+
+    def values(self, *expected: str) -> Condition[Collection]:
+        return self._values_condition(
+            'values', expected, predicate.equals_to_list(expected)
+        )
+
+    def values_containing(self, *expected: str) -> Condition[Collection]:
+        return self._values_condition(
+            'values containing',
+            expected,
+            predicate.equals_by_contains_to_list(expected),
+        )
+
+
+class _NotConditionWithValues(ElementCondition):
+    __slots__ = ('_original',)
+
+    def __init__(self, description, fn):
+        super().__init__(description, fn)
+        self._original = None
+
+    @classmethod
+    def of(cls, original: _ConditionWithValues):
+        negated = ElementCondition.as_not(original)
+        condition = cls(lambda: str(negated), negated.call)
+        condition._original = original
+        return condition
+
+    @property
+    def not_(self) -> Condition[Element]:
+        if self._original is None:
+            return ElementCondition.as_not(self)
+        return self._original
+
+    def value(self, *args, **kwargs) -> Condition[Element]:
+        return self._original.value(*args, **kwargs).not_
+
+    def value_containing(self, *args, **kwargs) -> Condition[Element]:
+        return self._original.value_containing(*args, **kwargs).not_
+
+    def values(self, *expected: str) -> Condition[Collection]:
+        return self._original.values(*expected).not_
+
+    def values_containing(self, *expected: str) -> Condition[Collection]:
+        return self._original.values_containing(*expected).not_
+
+
+class _AttributeCondition(_ConditionWithValues):
+    __slots__ = ()
+
+    @staticmethod
+    def _warn_if_ignoring_case(ignore_case):
+        if ignore_case:
+            warnings.warn(
+                'ignore_case syntax is experimental and might change in future',
+                FutureWarning,
             )
 
-        def value_containing(self, expected: str) -> Condition[Element]:
-            return ElementCondition.raise_if_not_actual(
-                f"has js property '{name}' with value containing '{expected}'",
-                property_value,
-                predicate.includes(expected),
-            )
+    def value(self, expected: str, ignore_case=False) -> Condition[Element]:
+        self._warn_if_ignoring_case(ignore_case)
+        return self._value_condition(
+            'value', expected, predicate.equals(expected, ignore_case)
+        )
 
-        def values(self, *expected: str) -> Condition[Collection]:
-            return CollectionCondition.raise_if_not_actual(
-                f"has js property '{name}' with values '{expected}'",
-                property_values,
-                predicate.equals_to_list(expected),
-            )
+    def value_containing(
+        self, expected: str, ignore_case=False
+    ) -> Condition[Element]:
+        self._warn_if_ignoring_case(ignore_case)
+        return self._value_condition(
+            'value containing',
+            expected,
+            predicate.includes(expected, ignore_case),
+        )
 
-        def values_containing(self, *expected: str) -> Condition[Collection]:
-            return CollectionCondition.raise_if_not_actual(
-                f"has js property '{name}' with values containing '{expected}'",
-                property_values,
-                predicate.equals_by_contains_to_list(expected),
-            )
 
-    return ConditionWithValues(
-        str(raw_property_condition), raw_property_condition.call
+@lru_cache(maxsize=128)
+def element_has_js_property(name: str):
+    # todo: should we keep simpler but less obvious name - *_has_property ?
+    return _ConditionWithValues.of(
+        'js property', name, lambda webelement: webelement.get_property(name)
     )
 
 
+@lru_cache(maxsize=128)
 def element_has_css_property(name: str):
-    def property_value(element: Element) -> str:
-        return element().value_of_css_property(name)
-
-    def property_values(collection: Collection) -> List[str]:
-        return [
-            element.value_of_css_property(name) for element in collection()
-        ]
-
-    raw_property_condition = ElementCondition.raise_if_not_actual(
-        'has css property ' + name, property_value, predicate.is_truthy
-    )
-
-    class ConditionWithValues(ElementCondition):
-        def value(self, expected: str) -> Condition[Element]:
-            return ElementCondition.raise_if_not_actual(
-                f"has css property '{name}' with value '{expected}'",
-                property_value,
-                predicate.equals(expected),
-            )
-
-        def value_containing(self, expected: str) -> Condition[Element]:
-            return ElementCondition.raise_if_not_actual(
-                f"has css property '{name}' with value containing '{expected}'",
-                property_value,
-                predicate.includes(expected),
-            )
-
-        def values(self, *expected: str) -> Condition[Collection]:
-            return CollectionCondition.raise_if_not_actual(
-                f"has css property '{name}' with values '{expected}'",
-                property_values,
-                predicate.equals_to_list(expected),
-            )
-
-        def values_containing(self, *expected: str) -> Condition[Collection]:
-            return CollectionCondition.raise_if_not_actual(
-                f"has css property '{name}' with values containing '{expected}'",
-                property_values,
-                predicate.equals_by_contains_to_list(expected),
-            )
-
-    return ConditionWithValues(
-        str(raw_property_condition), raw_property_condition.call
+    return _ConditionWithValues.of(
+        'css property',
+        name,
+        lambda webelement: webelement.value_of_css_property(name),
     )
 
 
+@lru_cache(maxsize=128)
 def element_has_attribute(name: str):
-    def attribute_value(element: Element) -> str:
-        return element().get_attribute(name)
-
-    def attribute_values(collection: Collection) -> List[str]:
-        return [element.get_attribute(name) for element in collection()]
-
-    raw_attribute_condition = ElementCondition.raise_if_not_actual(
-        'has attribute ' + name, attribute_value, predicate.is_truthy
-    )
-
-    class ConditionWithValues(ElementCondition):
-        def value(
-            self, expected: str, ignore_case=False
-        ) -> Condition[Element]:
-            if ignore_case:
-                warnings.warn(
-                    'ignore_case syntax is experimental and might change in future',
-                    FutureWarning,
-                )
-            return ElementCondition.raise_if_not_actual(
-                f"has attribute '{name}' with value '{expected}'",
-                attribute_value,
-                predicate.equals(expected, ignore_case),
-            )
-
-        def value_containing(
-            self, expected: str, ignore_case=False
-        ) -> Condition[Element]:
-            if ignore_case:
-                warnings.warn(
-                    'ignore_case syntax is experimental and might change in future',
-                    FutureWarning,
-                )
-            return ElementCondition.raise_if_not_actual(
-                f"has attribute '{name}' with value containing '{expected}'",
-                attribute_value,
-                predicate.includes(expected, ignore_case),
-            )
-
-        def values(self, *expected: str) -> Condition[Collection]:
-            return CollectionCondition.raise_if_not_actual(
-                f"has attribute '{name}' with values '{expected}'",
-                attribute_values,
-                predicate.equals_to_list(expected),
-            )
-
-        def values_containing(self, *expected: str) -> Condition[Collection]:
-            return CollectionCondition.raise_if_not_actual(
-                f"has attribute '{name}' with values containing '{expected}'",
-                attribute_values,
-                predicate.equals_by_contains_to_list(expected),
-            )
-
-    return ConditionWithValues(
-        str(raw_attribute_condition), raw_attribute_condition.call
+    return _AttributeCondition.of(
+        'attribute', name, lambda webelement: webelement.get_attribute(name)
     )
 
 
@@ -242,27 +265,41 @@ element_is_selected: Condition[Element] = element_has_attribute(
 )
 
 
+@memoized(maxsize=256)
 def element_has_value(expected: str) -> Condition[Element]:
-    return element_has_attribute('value').value(expected)
+    return ElementCondition.raise_if_not_actual(
+        lambda: f"has value '{expected}'",
+        query.value,
+        predicate.equals(expected),
+    )
 
 
 def element_has_value_containing(expected: str) -> Condition[Element]:
-    return element_has_attribute('value').value_containing(expected)
+    return ElementCondition.raise_if_not_actual(
+        lambda: f"has value containing '{expected}'",
+        query.value,
+        predicate.includes(expected),
+    )
 
 
+@memoized(maxsize=256)
 def element_has_css_class(expected: str) -> Condition[Element]:
     def class_attribute_value(element: Element) -> str:
         return element().get_attribute('class')
 
     return ElementCondition.raise_if_not_actual(
-        f"has css class '{expected}'",
+        lambda: f"has css class '{expected}'",
         class_attribute_value,
         predicate.includes_word(expected),
     )
 
 
-element_is_blank: Condition[Element] = element_has_exact_text('').and_(
-    element_has_value('')
+element_is_blank: Condition[Element] = ElementCondition.raise_if_not(
+    'is blank',
+    lambda element: element.execute_script(
+        "return (arguments[0].innerText || '').trim() === ''"
+        " && (arguments[0].value || '') === ''"
+    ),
 )
 
 
@@ -272,7 +309,7 @@ def element_has_tag(
     compared_by_predicate_to=predicate.equals,
 ) -> Condition[Element]:
     return ElementCondition.raise_if_not_actual(
-        f'{describing_matched_to} + {expected}',
+        lambda: f'{describing_matched_to} + {expected}',
         query.tag,
         compared_by_predicate_to(expected),
     )
@@ -296,17 +333,19 @@ collection_is_empty: Condition[Collection] = CollectionCondition.raise_if_not(
 )
 
 
+@memoized(maxsize=256)
 def collection_has_size(
     expected: int,
     describing_matched_to='has size',
     compared_by_predicate_to=predicate.equals,
 ) -> Condition[Collection]:
-    def size(collection: Collection) -> int:
-        return len(collection())
-
+    # todo: consider counting by js (querySelectorAll(...).length)
+    #       instead of fetching ids of all found webelements,
+    #       once collection will know its selector (locator knows only
+    #       the description and how to locate, e.g. from filtered collection)
     return CollectionCondition.raise_if_not_actual(
-        f'{describing_matched_to} {expected}',
-        size,
+        lambda: f'{describing_matched_to} {expected}',
+        query.size,
         compared_by_predicate_to(expected),
     )
 
@@ -343,17 +382,52 @@ def collection_has_size_less_than_or_equal(
     )
 
 
+# collects texts of all visible elements in one round trip to the browser
+# instead of asking for .text and .is_displayed() of each element separately;
+# visibility is checked close to webdriver's is_displayed
+# (rendered, not visibility:hidden, not transparent by itself or by ancestor,
+# options are as visible as their select, that has the only layout box)
+# and text is normalized like webdriver's visible text (nbsp to space, trimmed)
+_visible_texts_script = (
+    'function isVisible(e) {'
+    "  if (e.tagName === 'OPTION' || e.tagName === 'OPTGROUP') {"
+    "    var select = e.closest('select');"
+    '    if (select) return isVisible(select);'
+    '  }'
+    '  if (!(e.offsetWidth || e.offsetHeight || e.getClientRects().length))'
+    '    return false;'
+    "  if (window.getComputedStyle(e).visibility !== 'visible')"
+    '    return false;'
+    '  for (var p = e; p && p.nodeType === 1; p = p.parentNode) {'
+    '    if (parseFloat(window.getComputedStyle(p).opacity) === 0)'
+    '      return false;'
+    '  }'
+    '  return true;'
+    '}'
+    'var texts = [];'
+    'for (var i = 0; i < arguments.length; i++) {'
+    '  var e = arguments[i];'
+    '  if (isVisible(e))'
+    "    texts.push((e.innerText || e.textContent || '')"
+    "      .replace(/\\u00a0/g, ' ').trim());"
+    '}'
+    'return texts;'
+)
+
+
+def _visible_texts_of(collection: Collection) -> List[str]:
+    return collection.config.driver.execute_script(
+        _visible_texts_script, *collection()
+    )
+
+
 # todo: make it configurable whether assert only visible texts or ot
 def collection_has_texts(*expected: str) -> Condition[Collection]:
     def visible_texts(collection: Collection) -> List[str]:
-        return [
-            webelement.text
-            for webelement in collection()
-            if webelement.is_displayed()
-        ]
+        return _visible_texts_of(collection)
 
     return CollectionCondition.raise_if_not_actual(
-        f'has texts {expected}',
+        lambda: f'has texts {expected}',
         visible_texts,
         predicate.equals_by_contains_to_list(expected),
     )
@@ -361,32 +435,24 @@ def collection_has_texts(*expected: str) -> Condition[Collection]:
 
 def collection_has_exact_texts(*expected: str) -> Condition[Collection]:
     def visible_texts(collection: Collection) -> List[str]:
-        return [
-            webelement.text
-            for webelement in collection()
-            if webelement.is_displayed()
-        ]
+        return _visible_texts_of(collection)
 
     return CollectionCondition.raise_if_not_actual(
-        f'has exact texts {expected}',
+        lambda: f'has exact texts {expected}',
         visible_texts,
         predicate.equals_to_list(expected),
     )
 
 
-# todo: consider refactoring the code like below by moving outside fns like url, title, etc...
-# todo: probably we will do that nevertheless when reusing "commands&queries" inside element class definitions
+@memoized(maxsize=256)
 def browser_has_url(
     expected: str,
     describing_matched_to='has url',
     compared_by_predicate_to=predicate.equals,
 ) -> Condition[Browser]:
-    def url(browser: Browser) -> str:
-        return browser.driver.current_url
-
     return BrowserCondition.raise_if_not_actual(
-        f"{describing_matched_to} '{expected}'",
-        url,
+        lambda: f"{describing_matched_to} '{expected}'",
+        query.url,
         compared_by_predicate_to(expected),
     )
 
@@ -395,17 +461,15 @@ def browser_has_url_containing(expected: str) -> Condition[Browser]:
     return browser_has_url(expected, 'has url containing', predicate.includes)
 
 
+@memoized(maxsize=256)
 def browser_has_title(
     expected: str,
     describing_matched_to='has title',
     compared_by_predicate_to=predicate.equals,
 ) -> Condition[Browser]:
-    def title(browser: Browser) -> str:
-        return browser.driver.title
-
     return BrowserCondition.raise_if_not_actual(
-        f"{describing_matched_to} '{expected}'",
-        title,
+        lambda: f"{describing_matched_to} '{expected}'",
+        query.title,
         compared_by_predicate_to(expected),
     )
 
@@ -421,12 +485,9 @@ def browser_has_tabs_number(
     describing_matched_to='has tabs number',
     compared_by_predicate_to=predicate.equals,
 ) -> Condition[Browser]:
-    def tabs_number(browser: Browser) -> int:
-        return len(browser.driver.window_handles)
-
     return BrowserCondition.raise_if_not_actual(
-        f'{describing_matched_to} {expected}',
-        tabs_number,
+        lambda: f'{describing_matched_to} {expected}',
+        query.tabs_number,
         compared_by_predicate_to(expected),
     )
 
@@ -470,7 +531,7 @@ def browser_has_js_returned(
         return browser.driver.execute_script(script, *args)
 
     return BrowserCondition.raise_if_not_actual(
-        f'has the ```{script}``` script returned {expected}',
+        lambda: f'has the ```{script}``` script returned {expected}',
         script_result,
         predicate.equals(expected),
     )
@@ -19,6 +19,7 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+from operator import attrgetter
 from typing import List, Dict, Any, Union
 
 from selene.core.entity import Browser, Element, Collection
@@ -116,18 +117,16 @@ def js_property(name: str) -> Query[Element, str]:
 # --- Browser queries --- #
 
 
-url: Query[Browser, str] = Query(
-    'url', lambda browser: browser.driver.current_url
-)
+url: Query[Browser, str] = Query('url', attrgetter('driver.current_url'))
 
-title: Query[Browser, str] = Query(
-    'title', lambda browser: browser.driver.title
-)
+title: Query[Browser, str] = Query('title', attrgetter('driver.title'))
 
 tabs: Query[Browser, List[str]] = Query(
-    'tabs', lambda browser: browser.driver.window_handles
+    'tabs', attrgetter('driver.window_handles')
 )
 
+# window_handles is the only way to count tabs,
+# js window.length, for example, counts frames inside the current tab
 tabs_number: Query[Browser, int] = Query(
     'tabs number', lambda browser: len(browser.driver.window_handles)
 )
@@ -141,8 +140,7 @@ def tab(index: int) -> Query[Browser, str]:
 
 
 current_tab: Query[Browser, str] = Query(
-    'current tab (window handle)',
-    lambda browser: browser.driver.current_window_handle,
+    'current tab (window handle)', attrgetter('driver.current_window_handle')
 )
 
 
@@ -169,5 +167,5 @@ previous_tab: Query[Browser, str] = Query('previous tab', __previous_tab_fn)
 
 
 page_source: Query[Browser, str] = Query(
-    'page source', lambda browser: browser.driver.page_source
+    'page source', attrgetter('driver.page_source')
 )
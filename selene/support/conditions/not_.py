@@ -65,29 +65,7 @@ def attribute(name: str, value: str = None):
         )
         return _match.element_has_attribute(name).value(value).not_
 
-    original = _match.element_has_attribute(name)
-    negated = original.not_
-
-    def value(self, expected: str, ignore_case=False) -> Condition[Element]:
-        return original.value(expected, ignore_case).not_
-
-    def value_containing(
-        self, expected: str, ignore_case=False
-    ) -> Condition[Element]:
-        return original.value_containing(expected, ignore_case).not_
-
-    def values(self, *expected: str) -> Condition[Collection]:
-        return original.values(*expected).not_
-
-    def values_containing(self, *expected: str) -> Condition[Collection]:
-        return original.values_containing(*expected).not_
-
-    negated.value = value
-    negated.value_containing = value_containing
-    negated.values = values
-    negated.values_containing = values_containing
-
-    return negated
+    return _match.element_has_attribute(name).not_
 
 
 def js_property(name: str, value: str = None):
@@ -98,27 +76,7 @@ def js_property(name: str, value: str = None):
         )
         return _match.element_has_js_property(name).value(value).not_
 
-    original = _match.element_has_js_property(name)
-    negated = original.not_
-
-    def value(self, expected: str) -> Condition[Element]:
-        return original.value(expected).not_
-
-    def value_containing(self, expected: str) -> Condition[Element]:
-        return original.value_containing(expected).not_
-
-    def values(self, *expected: str) -> Condition[Collection]:
-        return original.values(*expected).not_
-
-    def values_containing(self, *expected: str) -> Condition[Collection]:
-        return original.values_containing(*expected).not_
-
-    negated.value = value
-    negated.value_containing = value_containing
-    negated.values = values
-    negated.values_containing = values_containing
-
-    return negated
+    return _match.element_has_js_property(name).not_
 
 
 def css_property(name: str, value: str = None):
@@ -129,27 +87,7 @@ def css_property(name: str, value: str = None):
         )
         return _match.element_has_css_property(name).value(value).not_
 
-    original = _match.element_has_css_property(name)
-    negated = original.not_
-
-    def value(self, expected: str) -> Condition[Element]:
-        return original.value(expected).not_
-
-    def value_containing(self, expected: str) -> Condition[Element]:
-        return original.value_containing(expected).not_
-
-    def values(self, *expected: str) -> Condition[Collection]:
-        return original.values(*expected).not_
-
-    def values_containing(self, *expected: str) -> Condition[Collection]:
-        return original.values_containing(*expected).not_
-
-    negated.value = value
-    negated.value_containing = value_containing
-    negated.values = values
-    negated.values_containing = values_containing
-
-    return negated
+    return _match.element_has_css_property(name).not_
 
 
 def value(text) -> Condition[Element]:
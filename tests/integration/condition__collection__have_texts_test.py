@@ -174,3 +174,55 @@ def test_should_have_no_text_exception(session_browser):
         browser.all('li').should(have.no.text('Alex'))
     assert "has no text Alex" in error.value.msg
     assert "ConditionNotMatchedError: condition not matched" in error.value.msg
+
+
+def test_should_have_texts_of_visible_elements_only(session_browser):
+    GivenPage(session_browser.driver).opened_with_body(
+        '''
+        <ul>Hello:
+           <li>Alex</li>
+           <li style="display:none">Hidden</li>
+           <li style="visibility:hidden">Invisible</li>
+           <li style="opacity:0">Transparent</li>
+           <li>Yakov</li>
+        </ul>
+        '''
+    )
+
+    session_browser.all('li').should(have.exact_texts('Alex', 'Yakov'))
+    session_browser.all('li').should(have.texts('Al', 'Ya'))
+
+
+def test_should_have_exact_texts_with_nbsp_as_space(session_browser):
+    GivenPage(session_browser.driver).opened_with_body(
+        '''
+        <ul>Hello:
+           <li>Alex&nbsp;Kramarenko</li>
+           <li> Yakov&nbsp;</li>
+        </ul>
+        '''
+    )
+
+    session_browser.all('li').should(
+        have.exact_texts('Alex Kramarenko', 'Yakov')
+    )
+
+
+def test_should_have_texts_of_options_in_visible_dropdown(session_browser):
+    GivenPage(session_browser.driver).opened_with_body(
+        '''
+        <select id="cars">
+           <option value="volvo">Volvo</option>
+           <option value="saab">Saab</option>
+        </select>
+        <select id="hidden-cars" style="display:none">
+           <option value="audi">Audi</option>
+        </select>
+        '''
+    )
+
+    session_browser.all('#cars option').should(
+        have.exact_texts('Volvo', 'Saab')
+    )
+    session_browser.all('#cars option').should(have.texts('Vol', 'Sa'))
+    session_browser.all('#hidden-cars option').should(have.exact_texts())
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2015-2021 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from selene import be
+from selene.core.exceptions import TimeoutException
+from tests.integration.helpers.givenpage import GivenPage
+
+
+def test_should_be_blank(session_browser):
+    GivenPage(session_browser.driver).opened_with_body(
+        '''
+        <input id="empty">
+        <input id="filled" value="Yakov">
+        <textarea id="empty-textarea"></textarea>
+        <p id="text">Hello</p>
+        '''
+    )
+
+    session_browser.element('#empty').should(be.blank)
+    session_browser.element('#empty-textarea').should(be.blank)
+    session_browser.element('#filled').should(be.not_.blank)
+    session_browser.element('#text').should(be.not_.blank)
+
+
+def test_should_be_blank_exception(session_browser):
+    browser = session_browser.with_(timeout=0.1)
+    GivenPage(browser.driver).opened_with_body(
+        '''
+        <input id="filled" value="Yakov">
+        '''
+    )
+
+    with pytest.raises(TimeoutException) as error:
+        browser.element('#filled').should(be.blank)
+    assert "is blank" in error.value.msg
+    assert "ConditionNotMatchedError: condition not matched" in error.value.msg
+
+
+def test_should_not_be_blank_if_hidden_with_text(session_browser):
+    GivenPage(session_browser.driver).opened_with_body(
+        '''
+        <p id="hidden-text" style="display:none">Hello</p>
+        <p id="hidden-empty" style="display:none"></p>
+        '''
+    )
+
+    # innerText of not rendered element is its textContent,
+    # unlike webdriver's .text that is '' for any hidden element
+    session_browser.element('#hidden-text').should(be.not_.blank)
+    session_browser.element('#hidden-empty').should(be.blank)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2015-2021 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from selene.core import match
+from selene.core.exceptions import TimeoutException
+from tests.integration.helpers.givenpage import GivenPage
+
+
+def test_should_be_focused(session_browser):
+    GivenPage(session_browser.driver).opened_with_body(
+        '''
+        <input id="first">
+        <input id="second">
+        '''
+    )
+
+    session_browser.element('#second').click()
+
+    session_browser.element('#second').should(match.element_is_focused)
+    session_browser.element('#first').should(match.element_is_focused.not_)
+
+
+def test_should_be_focused_exception(session_browser):
+    browser = session_browser.with_(timeout=0.1)
+    GivenPage(browser.driver).opened_with_body(
+        '''
+        <input id="first">
+        <input id="second">
+        '''
+    )
+
+    browser.element('#second').click()
+
+    with pytest.raises(TimeoutException) as error:
+        browser.element('#first').should(match.element_is_focused)
+    assert "is focused" in error.value.msg
+    assert "ConditionNotMatchedError: condition not matched" in error.value.msg
@@ -0,0 +1,56 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from selene.common.fp import memoized
+
+
+# noinspection PyPep8Naming
+class Test__memoized:
+    def test_returns_cached_result_for_same_hashable_args(self):
+        calls = []
+
+        @memoized(maxsize=8)
+        def fn(x):
+            calls.append(x)
+            return [x]
+
+        assert fn('a') is fn('a')
+        assert calls == ['a']
+
+    def test_distinguishes_args_by_type(self):
+        @memoized(maxsize=8)
+        def fn(x):
+            return [x]
+
+        assert fn(1) is not fn(True)
+
+    def test_calls_fn_without_caching_for_unhashable_args(self):
+        calls = []
+
+        @memoized(maxsize=8)
+        def fn(x):
+            calls.append(x)
+            return len(x)
+
+        assert fn(['a']) == 1
+        assert fn(['a']) == 1
+        assert calls == [['a'], ['a']]
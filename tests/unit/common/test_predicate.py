@@ -86,3 +86,84 @@ class Test__equals_to_list:
         expected = []
         actual = ['a']
         assert not equals_to_list(expected)(actual)
+
+
+from selene.common.predicate import includes_word
+
+
+# noinspection PyPep8Naming
+class Test__includes_word:
+    def test_single_word(self):
+        assert includes_word('a')('a')
+
+    def test_word_among_others(self):
+        assert includes_word('b')('a b  c')
+        assert includes_word('a')('a\tb')
+        assert includes_word('c')('a b\nc')
+
+    def test_part_of_word(self):
+        assert not includes_word('a')('ab b')
+        assert not includes_word('b')('a-b')
+
+    def test_special_chars_are_matched_literally(self):
+        assert includes_word('a.b')('x a.b')
+        assert not includes_word('a.b')('x aXb')
+
+    def test_ignoring_case(self):
+        assert includes_word('A', ignore_case=True)('b a')
+        assert not includes_word('A', ignore_case=True)('b ab')
+        assert not includes_word('A')('b a')
+
+
+from selene.common import predicate
+
+
+# noinspection PyPep8Naming
+class Test__equals:
+    def test_same(self):
+        assert predicate.equals('a')('a')
+        assert not predicate.equals('a')('A')
+
+    def test_ignoring_case(self):
+        assert predicate.equals('a', ignore_case=True)('A')
+        assert not predicate.equals('a', ignore_case=True)('b')
+
+
+# noinspection PyPep8Naming
+class Test__includes:
+    def test_part(self):
+        assert predicate.includes('b')('abc')
+        assert not predicate.includes('B')('abc')
+
+    def test_ignoring_case(self):
+        assert predicate.includes('B', ignore_case=True)('abc')
+        assert not predicate.includes('d', ignore_case=True)('abc')
+
+    def test_not_a_container(self):
+        assert not predicate.includes('a')(None)
+
+
+# noinspection PyPep8Naming
+class Test__comparing_numbers:
+    def test_is_greater_than(self):
+        assert predicate.is_greater_than(1)(2)
+        assert not predicate.is_greater_than(1)(1)
+
+    def test_is_greater_than_or_equal(self):
+        assert predicate.is_greater_than_or_equal(1)(1)
+        assert not predicate.is_greater_than_or_equal(1)(0)
+
+    def test_is_less_than(self):
+        assert predicate.is_less_than(1)(0)
+        assert not predicate.is_less_than(1)(1)
+
+    def test_is_less_than_or_equal(self):
+        assert predicate.is_less_than_or_equal(1)(1)
+        assert not predicate.is_less_than_or_equal(1)(2)
+
+
+# noinspection PyPep8Naming
+class Test__equals_to_list__with_nones:
+    def test_expected_list_is_bigger_by_none(self):
+        assert not equals_to_list([None])([])
+        assert not equals_to_list(['a', None])(['a'])
@@ -0,0 +1,172 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from selene.core.condition import Condition
+from selene.core.configuration import Config
+from selene.core.entity import Element, Collection
+from selene.core.locator import Locator
+
+
+# noinspection PyPep8Naming
+class Test__Condition__description:
+    def test_is_rendered_lazily_and_once(self):
+        renderings = []
+
+        def describe():
+            renderings.append(1)
+            return 'is ok'
+
+        condition = Condition(describe, lambda entity: None)
+        assert renderings == []
+
+        assert str(condition) == 'is ok'
+        assert str(condition) == 'is ok'
+        assert renderings == [1]
+
+    def test_of_inverted_condition(self):
+        condition = Condition(lambda: 'has text Hi', lambda entity: None)
+
+        assert str(condition.not_) == 'has no text Hi'
+        assert str(Condition('is visible', lambda entity: None).not_) == (
+            'is not visible'
+        )
+
+    def test_of_composed_conditions(self):
+        visible = Condition('is visible', lambda entity: None)
+        enabled = Condition(lambda: 'is enabled', lambda entity: None)
+
+        assert str(visible.and_(enabled)) == 'is visible and is enabled'
+        assert str(visible.or_(enabled)) == 'is visible or is enabled'
+
+
+class _Counter:
+    def __init__(self):
+        self.lookups = 0
+
+    def locate(self):
+        self.lookups += 1
+        return 'webelement'
+
+
+def _element(counter: _Counter) -> Element:
+    return Element(Locator('element', counter.locate), Config())
+
+
+def _not_cachable_collection() -> Collection:
+    def locate():
+        raise AssertionError('can not be located')
+
+    return Collection(Locator('collection', locate), Config())
+
+
+class _WithUnrelatedCached:
+    cached = True
+
+
+def _condition_located_as(description):
+    def fn(entity):
+        if entity() != 'webelement':
+            raise AssertionError('not located')
+
+    return Condition(description, fn)
+
+
+def _failing(passed):
+    def fn(entity):
+        passed.append(entity)
+        raise AssertionError('failed')
+
+    return Condition('fails', fn)
+
+
+# noinspection PyPep8Naming
+class Test__Condition__by_and:
+    def test_locates_entity_once_per_call_for_all_conditions(self):
+        counter = _Counter()
+        entity = _element(counter)
+        condition = (
+            _condition_located_as('is a')
+            .and_(_condition_located_as('is b'))
+            .and_(_condition_located_as('is c'))
+        )
+
+        condition.call(entity)
+        assert counter.lookups == 1
+
+        condition.call(entity)
+        assert counter.lookups == 2
+
+    def test_passes_entity_as_is_if_it_can_not_be_cached(self):
+        entity = _not_cachable_collection()
+        passed = []
+        remember = Condition('is remembered', passed.append)
+
+        remember.and_(remember).call(entity)
+
+        assert passed == [entity, entity]
+
+    def test_passes_not_located_entity_as_is(self):
+        entity = _WithUnrelatedCached()
+        passed = []
+        remember = Condition('is remembered', passed.append)
+
+        remember.and_(remember).call(entity)
+
+        assert passed == [entity, entity]
+
+
+# noinspection PyPep8Naming
+class Test__Condition__by_or:
+    def test_reuses_cached_entity_when_first_condition_fails(self):
+        counter = _Counter()
+        entity = _element(counter)
+        passed = []
+
+        def located(it):
+            passed.append(it)
+            assert it() == 'webelement'
+
+        condition = _failing(passed).or_(Condition('is a', located))
+
+        condition.call(entity)
+
+        assert counter.lookups == 1
+        assert len(passed) == 2
+        assert passed[0] is passed[1]
+        assert passed[0] is not entity
+        assert isinstance(passed[0], Element)
+
+    def test_passes_entity_as_is_if_it_can_not_be_cached(self):
+        entity = _not_cachable_collection()
+        passed = []
+
+        _failing(passed).or_(Condition('is ok', passed.append)).call(entity)
+
+        assert passed == [entity, entity]
+
+    def test_passes_not_located_entity_as_is(self):
+        entity = _WithUnrelatedCached()
+        passed = []
+
+        _failing(passed).or_(Condition('is ok', passed.append)).call(entity)
+
+        assert passed == [entity, entity]
@@ -0,0 +1,131 @@
+# MIT License
+#
+# Copyright (c) 2015-2019 Iakiv Kramarenko
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from selene.core import match
+
+
+class _WebElement:
+    def get_attribute(self, name):
+        return f'attribute {name}'
+
+    def get_property(self, name):
+        return f'property {name}'
+
+    def value_of_css_property(self, name):
+        return f'css {name}'
+
+
+def _element():
+    return _WebElement()
+
+
+def _collection():
+    return [_WebElement(), _WebElement()]
+
+
+# noinspection PyPep8Naming
+class Test__element_has_attribute:
+    def test_value(self):
+        condition = match.element_has_attribute('id').value('attribute id')
+
+        condition.call(_element)
+        assert str(condition) == "has attribute 'id' with value 'attribute id'"
+
+    def test_value_failure(self):
+        condition = match.element_has_attribute('id').value('foo')
+
+        with pytest.raises(AssertionError) as error:
+            condition.call(_element)
+        assert str(error.value) == 'actual attribute id: attribute id'
+
+    def test_values_containing(self):
+        match.element_has_attribute('id').values_containing('id', 'id').call(
+            _collection
+        )
+
+    def test_negated_value(self):
+        negated = match.element_has_attribute('id').not_
+
+        negated.value('foo').call(_element)
+        with pytest.warns(FutureWarning):
+            negated.value_containing('FOO', ignore_case=True).call(_element)
+        with pytest.raises(Exception):
+            negated.value('attribute id').call(_element)
+        assert str(negated) == 'has no attribute id'
+        assert negated.not_ is match.element_has_attribute('id')
+
+
+# noinspection PyPep8Naming
+class Test__element_has_js_and_css_property:
+    def test_value(self):
+        match.element_has_js_property('p').value('property p').call(_element)
+        match.element_has_css_property('c').value('css c').call(_element)
+
+    def test_negated_values(self):
+        match.element_has_js_property('p').not_.values('x', 'y').call(
+            _collection
+        )
+        match.element_has_css_property('c').not_.values('x', 'y').call(
+            _collection
+        )
+
+
+# noinspection PyPep8Naming
+class Test__lazy_descriptions:
+    def test_are_rendered_for_not_str_expected_values(self):
+        assert str(match.element_has_text(5)) == 'has text 5'
+        assert str(match.element_has_exact_text(5)) == 'has exact text 5'
+        assert str(match.element_has_value(0)) == "has value '0'"
+        assert str(match.browser_has_url(None)) == "has url 'None'"
+        assert str(match.collection_has_exact_texts(1, 2)) == (
+            'has exact texts (1, 2)'
+        )
+
+
+# noinspection PyPep8Naming
+class Test__conditions_with_values__inherited_builders:
+    @pytest.mark.parametrize(
+        'condition',
+        [
+            match.element_has_attribute('id'),
+            match.element_has_js_property('p'),
+            match.element_has_attribute('id').not_,
+        ],
+    )
+    def test_build_conditions_of_same_type(self, condition):
+        cls = type(condition)
+        passed = cls.raise_if_not('is ok', lambda entity: True)
+        failed = cls.raise_if_not_actual(
+            'is not ok', lambda entity: 'actual', lambda actual: False
+        )
+
+        passed.call(_element)
+        with pytest.raises(AssertionError):
+            failed.call(_element)
+        cls.as_not(failed).call(_element)
+        cls.by_and(passed, passed).call(_element)
+        cls.by_or(failed, passed).call(_element)
+        assert str(cls.as_not(passed)) == 'is not ok'
+        assert isinstance(passed, cls)
+        assert str(passed.not_) == 'is not ok'